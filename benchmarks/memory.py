@@ -0,0 +1,39 @@
+"""Measure the memory held by parsed plisp programs.
+
+Run from the repository root:
+
+    python -m benchmarks.memory
+"""
+import gc
+import tracemalloc
+
+from plisp import parser
+
+FORMS = 2000
+ELEMENTS = 5000
+
+
+def retained_bytes(program):
+    """Parse program and return the AST along with the bytes it retains."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ast = parser.PLispParser(program).parse()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ast, after - before
+
+
+def main():
+    forms = '\n'.join('(define x%d (if #t (list %d "s" nil) #f))' % (i, i) for i in range(FORMS))
+    ast, used = retained_bytes(forms)
+    print("bytes per parsed form:   %.1f" % (used / len(ast)))
+
+    elements = "'(" + ' '.join(str(i) for i in range(ELEMENTS)) + ")"
+    ast, used = retained_bytes(elements)
+    print("bytes per list element:  %.1f" % (used / ELEMENTS))
+
+
+if __name__ == '__main__':
+    main()
@@ -74,8 +74,7 @@ class IfForm(types.Callable):
     def apply(self, args, call_env):
         if len(args) != 3:
             raise SyntaxError("if must be of form: if test then else")
-        test = types.Boolean(args[0].evaluate(call_env))
-        if test:
+        if args[0].evaluate(call_env):
             return args[1].evaluate(call_env)
         else:
             return args[2].evaluate(call_env)
@@ -120,102 +119,233 @@ class DefMacroForm(types.Callable):
 # Built-in functions
 
 class BuiltinFunction(types.Function):
+    __slots__ = ()
+
     def __init__(self, env):
         self.env = env
 
-class ListReduceBuiltin(BuiltinFunction):
-    func = lambda x, y: None
+
+class NativeFunction(BuiltinFunction):
+    """A builtin backed by a plain Python function.
+
+    Arguments are evaluated once and passed positionally. When an arity is
+    declared it is checked up front, and the common small arities are called
+    without building an intermediate argument list.
+    """
+    __slots__ = ('name', 'func', 'arity')
+
+    def __init__(self, env, name, func, arity=None):
+        super().__init__(env)
+        self.name = name
+        self.func = func
+        self.arity = arity
 
     def apply(self, args, call_env):
-        return reduce(self.__class__.func, [a.evaluate(call_env) for a in args])
+        arity = self.arity
+        if arity is None:
+            return self.func(*[a.evaluate(call_env) for a in args])
+        if len(args) != arity:
+            raise types.ArityError("%s expects %d argument(s), got %d" % (self.name, arity, len(args)))
+        if arity == 0:
+            return self.func()
+        if arity == 1:
+            return self.func(args[0].evaluate(call_env))
+        if arity == 2:
+            return self.func(args[0].evaluate(call_env), args[1].evaluate(call_env))
+        if arity == 3:
+            return self.func(args[0].evaluate(call_env), args[1].evaluate(call_env),
+                             args[2].evaluate(call_env))
+        return self.func(*[a.evaluate(call_env) for a in args])
 
+    def __str__(self):
+        return "<builtin %s>" % self.name
 
-class AddFunction(ListReduceBuiltin):
-    func = lambda x, y: x + y
-    
 
-class SubtractFunction(ListReduceBuiltin):
-    func = lambda x, y: x - y
+class BuiltinRegistry:
+    """A named collection of native functions that can be installed into an
+    environment in one go."""
 
+    def __init__(self):
+        self.functions = {}
 
-class MultiplyFunction(ListReduceBuiltin):
-    func = lambda x, y: x * y
+    def builtin(self, name, arity=None):
+        def decorator(func):
+            self.functions[name] = (func, arity)
+            return func
+        return decorator
 
+    def install(self, env):
+        for name, (func, arity) in self.functions.items():
+            env.set_symbol(name, NativeFunction(env, name, func, arity))
+        return env
 
-class DivisionFunction(ListReduceBuiltin):
-    func = lambda x, y: x / y
 
+default_registry = BuiltinRegistry()
+builtin = default_registry.builtin
 
-class EqualityFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 2:
-            raise Exception("Arity error")
-        return types.Boolean(args[0].evaluate(call_env) == args[1].evaluate(call_env))
 
+@builtin('+')
+def add(*args):
+    return reduce(lambda x, y: x + y, args)
 
-class ListFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        return types.List(*[e.evaluate(call_env) for e in args])
 
+@builtin('-')
+def subtract(*args):
+    return reduce(lambda x, y: x - y, args)
 
-class ConsFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 2:
-            raise Exception("Arity error")
-        elem = args[0].evaluate(call_env)
-        tgt = args[1].evaluate(call_env)
-        if not isinstance(tgt, types.List):
-            raise SyntaxError("the second argument of cons must be a list")
-        return types.List(elem, *tgt.elements)
 
+@builtin('*')
+def multiply(*args):
+    return reduce(lambda x, y: x * y, args)
 
-class FirstFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 1:
-            raise Exception("Arity error")
-        tgt = args[0].evaluate(call_env)
-        if not isinstance(tgt, types.List):
-            raise SyntaxError("first only accepts a list")
-        if len(tgt) == 0:
-            return types.List()
-        return tgt.elements[0]
 
+@builtin('/')
+def divide(*args):
+    return reduce(lambda x, y: x / y, args)
 
-class RestFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 1:
-            raise Exception("Arity error")
-        tgt = args[0].evaluate(call_env)
-        if not isinstance(tgt, types.List):
-            raise SyntaxError("rest only accepts a list")
-        return types.List(*tgt.elements[1:])
 
+@builtin('eq?', arity=2)
+def equal(a, b):
+    return types.Boolean(a == b)
 
-class TypeFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 1:
-            raise SyntaxError("type must be in form: type expression")
-        return args[0].evaluate(call_env).__class__
 
+@builtin('list')
+def make_list(*args):
+    return types.List(*args)
 
-class PrintFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        string = ' '.join([str(a.evaluate(call_env)) for a in args])
-        print(string)
+
+@builtin('cons', arity=2)
+def cons(elem, tgt):
+    if not isinstance(tgt, types.List):
+        raise SyntaxError("the second argument of cons must be a list")
+    return types.List(elem, *tgt.elements)
+
+
+@builtin('first', arity=1)
+def first(tgt):
+    if not isinstance(tgt, types.List):
+        raise SyntaxError("first only accepts a list")
+    if len(tgt) == 0:
         return types.List()
+    return tgt.elements[0]
 
 
-class ImportFunction(BuiltinFunction):
-    def apply(self, args, call_env):
-        if len(args) != 1:
-            raise SyntaxError("import must be in form: import name")
-        name = args[0].evaluate(call_env)
-        if type(name) is not types.String:
-            raise SyntaxError("import only accepts a string")
-        try:
-            mod = __import__(name.value)
-        except ImportError as e:
-            if name.value in __builtins__:
-                return __builtins__[name.value]
-            raise
-        return mod
+@builtin('rest', arity=1)
+def rest(tgt):
+    if not isinstance(tgt, types.List):
+        raise SyntaxError("rest only accepts a list")
+    return types.List(*tgt.elements[1:])
+
+
+@builtin('type', arity=1)
+def type_of(value):
+    return value.__class__
+
+
+@builtin('print')
+def print_values(*args):
+    print(' '.join([str(a) for a in args]))
+    return types.List()
+
+
+@builtin('import', arity=1)
+def import_module(name):
+    if type(name) is not types.String:
+        raise SyntaxError("import only accepts a string")
+    try:
+        mod = __import__(name.value)
+    except ImportError as e:
+        if name.value in __builtins__:
+            return __builtins__[name.value]
+        raise
+    return mod
+
+
+# String functions
+
+def _string_value(value, name):
+    if type(value) is not types.String:
+        raise SyntaxError(name + " only accepts strings")
+    return value.value
+
+
+def _index_value(value, name):
+    if type(value) is not types.Number or value.value != int(value.value):
+        raise SyntaxError(name + " expects an integer")
+    return int(value.value)
+
+
+def _format_value(value):
+    # Numbers and strings keep their Python value so format specs apply;
+    # everything else is rendered the way str and print render it.
+    if type(value) in (types.Number, types.String):
+        return value.value
+    return str(value)
+
+
+@builtin('str')
+def to_string(*args):
+    return types.String(''.join([str(a) for a in args]))
+
+
+@builtin('concat')
+def concat(*args):
+    return types.String(''.join([_string_value(a, "concat") for a in args]))
+
+
+@builtin('join', arity=2)
+def join(sep, seq):
+    if not isinstance(seq, types.List):
+        raise SyntaxError("the second argument of join must be a list")
+    return types.String(_string_value(sep, "join").join([str(e) for e in seq.elements]))
+
+
+@builtin('split', arity=2)
+def split(string, sep):
+    sep = _string_value(sep, "split")
+    if sep == '':
+        raise SyntaxError("split separator must not be empty")
+    parts = _string_value(string, "split").split(sep)
+    return types.List(*[types.String(p) for p in parts])
+
+
+@builtin('substring', arity=3)
+def substring(string, start, end):
+    string = _string_value(string, "substring")
+    return types.String(string[_index_value(start, "substring"):_index_value(end, "substring")])
+
+
+@builtin('string-length', arity=1)
+def string_length(string):
+    return types.Number(len(_string_value(string, "string-length")))
+
+
+@builtin('format')
+def format_string(*args):
+    if len(args) == 0:
+        raise types.ArityError("format expects at least 1 argument, got 0")
+    fmt = _string_value(args[0], "format")
+    return types.String(fmt.format(*[_format_value(a) for a in args[1:]]))
+
+
+@builtin('string-builder')
+def string_builder(*args):
+    sb = types.StringBuilder()
+    for a in args:
+        sb.append(str(a))
+    return sb
+
+
+@builtin('sb-append', arity=2)
+def sb_append(sb, value):
+    if type(sb) is not types.StringBuilder:
+        raise SyntaxError("the first argument of sb-append must be a string builder")
+    sb.append(str(value))
+    return sb
+
+
+@builtin('sb-string', arity=1)
+def sb_string(sb):
+    if type(sb) is not types.StringBuilder:
+        raise SyntaxError("sb-string only accepts a string builder")
+    return types.String(sb.build())
@@ -2,11 +2,20 @@ from plisp import types
 
 class Environment:
     def __init__(self, base=None):
+        # version is bumped on every binding change so call-site caches can
+        # tell whether a resolution they made earlier still holds. A child
+        # environment remembers the version of its base at copy time, which
+        # lets caches share resolutions of names the child never rebinds.
+        self.version = 0
+        self.base = base
+        self.local_names = set()
         if base is None:
+            self.base_version = 0
             self.table = {}
             self.macros = {}
             self.forms = {}
         else:
+            self.base_version = base.version
             self.table = base.table.copy()
             self.forms = base.forms.copy()
             self.macros = base.macros.copy()
@@ -17,7 +26,24 @@ class Environment:
 
     def _set_in_table(self, symbol, value, table):
         table[symbol] = value
+        self.local_names.add(symbol)
+        self.version += 1
         return value
+
+    def resolution_owner(self, symbol):
+        """Return the environment and version that determine what symbol
+        resolves to here."""
+        if self.base is not None and symbol not in self.local_names:
+            return self.base, self.base_version
+        return self, self.version
+
+    def resolves_as(self, symbol, owner, version):
+        """Check whether symbol still resolves here as it did in owner at
+        the given version."""
+        if owner is self:
+            return self.version == version
+        return (owner is self.base and self.base_version == version and
+                symbol not in self.local_names)
     
     def in_forms(self, symbol):
         return symbol in self.forms
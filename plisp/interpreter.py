@@ -6,6 +6,7 @@ from plisp import types
 
 class DefaultEnvironment(environment.Environment): 
     def __init__(self):
+        super().__init__()
         self.forms = {
                 'lambda': builtins.LambdaForm(),
                 'define': builtins.DefineForm(),
@@ -23,25 +24,14 @@ class DefaultEnvironment(environment.Environment):
         self.macros = {}
 
         self.table = {
-                # Built-in functions
-                '+': builtins.AddFunction(self),
-                '-': builtins.SubtractFunction(self),
-                '*': builtins.MultiplyFunction(self),
-                '/': builtins.DivisionFunction(self),
-                'eq?': builtins.EqualityFunction(self),
-                'list': builtins.ListFunction(self),
-                'cons': builtins.ConsFunction(self),
-                'first': builtins.FirstFunction(self),
-                'rest': builtins.RestFunction(self),
-                'type': builtins.TypeFunction(self),
-                'print': builtins.PrintFunction(self),
-                'import': builtins.ImportFunction(self),
                 # Type constants
-                'nil': types.List(),
-                '#t': types.Boolean(True),
-                '#f': types.Boolean(False),
+                'nil': types.NIL,
+                '#t': types.TRUE,
+                '#f': types.FALSE,
             }
 
+        builtins.default_registry.install(self)
+
 
 class PLispInterpreter:
     instance = None
@@ -50,6 +40,11 @@ class PLispInterpreter:
         self.environment = DefaultEnvironment()
         PLispInterpreter.instance = self
 
+    def register_builtins(self, registry):
+        """Install every native function in ``registry`` into the global
+        environment."""
+        return registry.install(self.environment)
+
     def _execute(self, program):
         plist_parser = parser.PLispParser(program) 
         ast = plist_parser.parse()
@@ -27,7 +27,7 @@ class PLispParser:
         (r'`', PLispTokens.BACKQUOTE),
         (r',', PLispTokens.UNQUOTE),
         (r'[<>=\+\-\*/]', PLispTokens.SYMBOL),
-        (r'[!\.#A-z]+[_A-z0-9\?]*', PLispTokens.SYMBOL),
+        (r'[!\.#A-z]+[_A-z0-9\?\-]*', PLispTokens.SYMBOL),
         (r'"[^"]*"', PLispTokens.STRING),
         (r';.*(?:$|\n)', PLispTokens.COMMENT)
     ]
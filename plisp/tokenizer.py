@@ -2,6 +2,8 @@ import re
 
 
 class Token:
+    __slots__ = ('type', 'value')
+
     def __init__(self, type, value):
         self.type = type
         self.value = value
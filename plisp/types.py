@@ -1,9 +1,16 @@
 from plisp import environment
 
 
-class Type: pass
+class Type:
+    __slots__ = ()
+
+
+class ArityError(Exception): pass
+
 
 class Atom(Type):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -21,8 +28,14 @@ class Atom(Type):
 
 
 class Boolean(Atom):
+    __slots__ = ()
+
+    # There are only two booleans; Boolean(x) returns TRUE or FALSE.
+    def __new__(cls, value):
+        return TRUE if value else FALSE
+
     def __init__(self, value):
-        self.value = bool(value)
+        pass
 
     def __bool__(self):
         return self.value
@@ -32,6 +45,8 @@ class Boolean(Atom):
 
 
 class Number(Atom):
+    __slots__ = ()
+
     def __init__(self, value):
         if type(value) in (float, int):
             self.value = value
@@ -74,6 +89,8 @@ class Number(Atom):
 
 
 class String(Atom):
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             self.value = str(value)
@@ -81,20 +98,90 @@ class String(Atom):
             raise
 
 
+class CallSiteStats:
+    """Hit and miss counts for the inline caches at symbol-headed call sites."""
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def hit_rate(cls):
+        total = cls.hits + cls.misses
+        if total == 0:
+            return 0.0
+        return cls.hits / total
+
+    @classmethod
+    def reset(cls):
+        cls.hits = 0
+        cls.misses = 0
+
+
+class StringBuilder(Type):
+    """A mutable buffer for building strings in linear time."""
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        self.parts = []
+
+    def append(self, text):
+        self.parts.append(text)
+
+    def build(self):
+        # Collapse the parts so repeated sb-string calls stay cheap.
+        if len(self.parts) > 1:
+            self.parts = [''.join(self.parts)]
+        return self.parts[0] if self.parts else ''
+
+    def evaluate(self, env):
+        return self
+
+    def pytype(self):
+        return self.build()
+
+    def __str__(self):
+        return self.build()
+
+    def __repr__(self):
+        return str(self)
+
+
 class List(Type):
+    __slots__ = ('elements', 'cache')
+
+    # The empty list is shared; List() returns NIL.
+    def __new__(cls, *args):
+        if not args and cls is List:
+            return NIL
+        return super().__new__(cls)
+
     def __init__(self, *args):
         self.elements = args
+        # Inline cache for the head symbol: (owner env, version, callable, is_macro)
+        self.cache = None
 
     def evaluate(self, env):
-        if len(self.elements) == 0:
+        elements = self.elements
+        if len(elements) == 0:
             return self
-        sym = self.elements[0].evaluate(env)
-        if isinstance(sym, Macro):
-            expr = sym.expand(self.elements[1:], env)
+        head = elements[0]
+        cache = self.cache
+        if cache is not None and env.resolves_as(head, cache[0], cache[1]):
+            CallSiteStats.hits += 1
+            sym = cache[2]
+            is_macro = cache[3]
+        else:
+            sym = head.evaluate(env)
+            is_macro = isinstance(sym, Macro)
+            if not is_macro and not isinstance(sym, Callable):
+                raise SyntaxError(str(sym) + " is not callable")
+            if type(head) is Symbol:
+                CallSiteStats.misses += 1
+                owner, version = env.resolution_owner(head)
+                self.cache = (owner, version, sym, is_macro)
+        if is_macro:
+            expr = sym.expand(elements[1:], env)
             return expr.evaluate(env)
-        if isinstance(sym, Callable):
-            return sym.apply(self.elements[1:], env)
-        raise SyntaxError(str(sym) + " is not callable")
+        return sym.apply(elements[1:], env)
 
     def pytype(self):
         return [e.pytype() for e in self.elements]
@@ -119,6 +206,8 @@ class List(Type):
 
 
 class Symbol(Type):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -147,11 +236,15 @@ class Symbol(Type):
 
 
 class Callable(Type):
+    __slots__ = ()
+
     def apply(self, args, call_env):
         raise NotImplementedError("Cannot evaluate abstract callable")
 
 
 class Function(Callable):
+    __slots__ = ('args_list', 'env', 'expression')
+
     def __init__(self, args_list, expr, env):
         self.args_list = args_list
         self.env = env
@@ -160,7 +253,7 @@ class Function(Callable):
     def apply(self, args, call_env):
         env = environment.Environment(base=self.env)
         if len(args) != len(self.args_list):
-            raise Exception("Arity error")
+            raise ArityError("expected %d argument(s), got %d" % (len(self.args_list), len(args)))
         bindings = zip(self.args_list, args)
         for sym, val in bindings:
             env.set_symbol(sym, val.evaluate(call_env))
@@ -168,6 +261,8 @@ class Function(Callable):
 
 
 class Macro(Type):
+    __slots__ = ('args_list', 'expression')
+
     def __init__(self, args_list, expr):
         self.args_list = args_list
         self.expression = expr
@@ -179,6 +274,15 @@ class Macro(Type):
         return self.expression.evaluate(env)
 
 
+TRUE = object.__new__(Boolean)
+TRUE.value = True
+FALSE = object.__new__(Boolean)
+FALSE.value = False
+NIL = object.__new__(List)
+NIL.elements = ()
+NIL.cache = None
+
+
 def to_lisp_type(instance):
     if isinstance(instance, str):
         return String(instance)